@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -50,29 +52,85 @@ EXCLUDED_MODULES = (
 )
 
 
+# Large, hot binaries that must stay uncompressed so Windows can demand-page and
+# share their code pages instead of unpacking them into private memory at start.
+UPX_EXCLUDES = (
+    "Qt6Core.dll",
+    "Qt6Gui.dll",
+    "Qt6Widgets.dll",
+    "PySide6\\*.pyd",
+    "python3*.dll",
+    "vcruntime*.dll",
+)
+
+
+HIDDEN_IMPORTS = ("pytesseract.pytesseract",)
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent
 ICON_FILENAME = "image.ico"
 
 
-def _build_arguments(args: argparse.Namespace) -> list[str]:
-    project_root = Path(__file__).resolve().parent
-    main_script = project_root / "src" / "main.py"
+@functools.lru_cache(maxsize=1)
+def _find_upx_dir(explicit: str | None) -> str | None:
+    """Return the UPX folder, scanning ``PATH`` only when none was given."""
+
+    if explicit:
+        return explicit
+    detected_upx = shutil.which("upx")
+    if detected_upx:
+        return str(Path(detected_upx).parent)
+    return None
 
+
+def _entry_point() -> Path:
+    main_script = PROJECT_ROOT / "src" / "main.py"
     if not main_script.exists():
         raise SystemExit(f"Cannot find entry point at {main_script}")
+    return main_script
+
+
+def _resolve_icon(args: argparse.Namespace) -> Path | None:
+    if args.icon:
+        icon_path = Path(args.icon)
+        if not icon_path.exists():
+            raise SystemExit(f"Icon not found: {icon_path}")
+        # PyInstaller resolves relative spec paths against the spec's folder, which
+        # is the build directory rather than the caller's working directory.
+        return icon_path.resolve()
+
+    default_icon = PROJECT_ROOT / ICON_FILENAME
+    if default_icon.exists():
+        return default_icon
+    return None
+
+
+def _check_runtime_tmpdir(args: argparse.Namespace) -> None:
+    if args.runtime_tmpdir and args.pack != "onefile":
+        raise SystemExit("--runtime-tmpdir only applies to --pack onefile builds")
+
+
+def _build_arguments(args: argparse.Namespace) -> list[str]:
+    """Return a PyInstaller command line that builds straight from ``main.py``."""
+
+    main_script = _entry_point()
+    _check_runtime_tmpdir(args)
 
     options: list[str] = [
         "--noconfirm",
         "--windowed",
-        "--onefile",
-        "--clean",
+        f"--{args.pack}",
         "--optimize",
         "2",
         "--name",
         args.name,
         f"--distpath={args.dist_dir}",
         f"--workpath={args.build_dir}",
-        "--hidden-import=pytesseract.pytesseract",
     ]
+    options.extend(f"--hidden-import={module}" for module in HIDDEN_IMPORTS)
+
+    if args.clean:
+        options.append("--clean")
 
     if args.strip:
         options.append("--strip")
@@ -80,25 +138,16 @@ def _build_arguments(args: argparse.Namespace) -> list[str]:
     for module in EXCLUDED_MODULES:
         options.append(f"--exclude-module={module}")
 
-    if not args.no_upx:
-        upx_dir = args.upx_dir
+    if args.no_upx:
+        options.append("--noupx")
+    else:
+        upx_dir = _find_upx_dir(args.upx_dir)
         if upx_dir:
             options.append(f"--upx-dir={upx_dir}")
-        else:
-            detected_upx = shutil.which("upx")
-            if detected_upx:
-                options.append(f"--upx-dir={Path(detected_upx).parent}")
-
-    icon_path: Path | None = None
-    if args.icon:
-        icon_path = Path(args.icon)
-        if not icon_path.exists():
-            raise SystemExit(f"Icon not found: {icon_path}")
-    else:
-        default_icon = project_root / ICON_FILENAME
-        if default_icon.exists():
-            icon_path = default_icon
+        for pattern in UPX_EXCLUDES:
+            options.append(f"--upx-exclude={pattern}")
 
+    icon_path = _resolve_icon(args)
     if icon_path is not None:
         options.append(f"--icon={icon_path}")
         options.append(f"--add-data={icon_path}{os.pathsep}.")
@@ -110,11 +159,148 @@ def _build_arguments(args: argparse.Namespace) -> list[str]:
     return options
 
 
+def _render_spec(args: argparse.Namespace) -> str:
+    """Render an equivalent ``.spec`` file for the options in ``args``."""
+
+    main_script = _entry_point()
+    _check_runtime_tmpdir(args)
+    icon_path = _resolve_icon(args)
+    icon = str(icon_path) if icon_path is not None else None
+    datas = [(icon, ".")] if icon is not None else []
+    upx = not args.no_upx
+    upx_exclude = list(UPX_EXCLUDES) if upx else []
+
+    lines = [
+        "# -*- mode: python ; coding: utf-8 -*-",
+        "# Generated by build.py; edit EXCLUDED_MODULES/UPX_EXCLUDES there instead.",
+        "a = Analysis(",
+        f"    [{str(main_script)!r}],",
+        f"    datas={datas!r},",
+        f"    hiddenimports={list(HIDDEN_IMPORTS)!r},",
+        "    excludes=[",
+        *(f"        {module!r}," for module in EXCLUDED_MODULES),
+        "    ],",
+        "    optimize=2,",
+        ")",
+        "pyz = PYZ(a.pure)",
+    ]
+    if args.pack == "onefile":
+        lines += [
+            "exe = EXE(",
+            "    pyz,",
+            "    a.scripts,",
+            "    a.binaries,",
+            "    a.datas,",
+            "    [],",
+            f"    name={args.name!r},",
+            f"    strip={args.strip!r},",
+            f"    upx={upx!r},",
+            f"    upx_exclude={upx_exclude!r},",
+            f"    runtime_tmpdir={args.runtime_tmpdir!r},",
+            "    console=False,",
+            f"    icon={icon!r},",
+            ")",
+        ]
+    else:
+        lines += [
+            "exe = EXE(",
+            "    pyz,",
+            "    a.scripts,",
+            "    [],",
+            "    exclude_binaries=True,",
+            f"    name={args.name!r},",
+            f"    strip={args.strip!r},",
+            f"    upx={upx!r},",
+            "    console=False,",
+            f"    icon={icon!r},",
+            ")",
+            "coll = COLLECT(",
+            "    exe,",
+            "    a.binaries,",
+            "    a.datas,",
+            f"    strip={args.strip!r},",
+            f"    upx={upx!r},",
+            f"    upx_exclude={upx_exclude!r},",
+            f"    name={args.name!r},",
+            ")",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _spec_build_arguments(args: argparse.Namespace) -> list[str]:
+    """Write ``<name>.spec`` into the work folder and return arguments to build it.
+
+    Keeping the excludes inside ``Analysis`` lets PyInstaller reuse the analysis
+    cache for the same spec across builds, and keeps the option list off the
+    command line entirely.
+    """
+
+    spec_text = _render_spec(args)
+    spec_path = Path(args.build_dir) / f"{args.name}.spec"
+    spec_path.parent.mkdir(parents=True, exist_ok=True)
+    if not spec_path.exists() or spec_path.read_text(encoding="utf-8") != spec_text:
+        spec_path.write_text(spec_text, encoding="utf-8")
+
+    options: list[str] = [
+        "--noconfirm",
+        f"--distpath={args.dist_dir}",
+        f"--workpath={args.build_dir}",
+    ]
+    if args.clean:
+        options.append("--clean")
+    if not args.no_upx:
+        upx_dir = _find_upx_dir(args.upx_dir)
+        if upx_dir:
+            options.append(f"--upx-dir={upx_dir}")
+
+    options.append(str(spec_path))
+    return options
+
+
+def _warn_on_incompatible_pillow() -> None:
+    """Warn when the installed Pillow is known to break under ``--optimize 2``."""
+
+    try:
+        import PIL
+    except ImportError:  # pragma: no cover - depends on developer setup
+        return
+
+    try:
+        version = tuple(int(part) for part in PIL.__version__.split(".")[:2])
+    except ValueError:  # pragma: no cover - unusual development builds
+        return
+
+    if version < (5, 3):
+        print(
+            f"peringatan: Pillow {PIL.__version__} gagal dimuat bila docstring dihapus "
+            "oleh --optimize 2. Perbarui Pillow (lihat requirements.txt) sebelum build.",
+            file=sys.stderr,
+        )
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--name", default="ORC-WIN", help="Nama executable yang dihasilkan")
     parser.add_argument("--dist-dir", default="dist", help="Folder output PyInstaller")
-    parser.add_argument("--build-dir", default="build", help="Folder kerja PyInstaller")
+    parser.add_argument(
+        "--build-dir",
+        default=str(Path(tempfile.gettempdir()) / "ORC-WIN-build"),
+        help="Folder kerja PyInstaller (default di folder sementara agar cache analisis tetap cepat)",
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Hapus cache PyInstaller sebelum build (disarankan untuk build rilis/CI)",
+    )
+    parser.add_argument(
+        "--pack",
+        choices=("onedir", "onefile"),
+        default="onedir",
+        help=(
+            "Format bundle: 'onedir' (default, start lebih cepat tanpa ekstraksi) "
+            "atau 'onefile' (satu berkas .exe)"
+        ),
+    )
     parser.add_argument(
         "--strip",
         action="store_true",
@@ -133,9 +319,14 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--icon",
         help="File icon .ico opsional untuk disematkan ke executable",
     )
+    parser.add_argument(
+        "--no-spec",
+        action="store_true",
+        help="Panggil PyInstaller langsung dengan argumen CLI tanpa membuat berkas .spec",
+    )
     parser.add_argument(
         "--runtime-tmpdir",
-        help="Override lokasi ekstraksi runtime PyInstaller untuk keamanan tambahan",
+        help="Override lokasi ekstraksi runtime PyInstaller (hanya untuk --pack onefile)",
     )
     return parser.parse_args(argv)
 
@@ -150,7 +341,11 @@ def main(argv: list[str] | None = None) -> int:
             "PyInstaller belum terpasang. Jalankan 'pip install pyinstaller' di environment aktif."
         ) from exc
 
-    arguments = _build_arguments(args)
+    _warn_on_incompatible_pillow()
+    if args.no_spec:
+        arguments = _build_arguments(args)
+    else:
+        arguments = _spec_build_arguments(args)
     pyinstaller_run(arguments)
     return 0
 
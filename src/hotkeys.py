@@ -1,9 +1,8 @@
 """Cross-version global hotkey helper built on the Win32 API."""
 from __future__ import annotations
 
-import itertools
 import sys
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QAbstractNativeEventFilter, QObject, Signal, Qt
 from PySide6.QtGui import QGuiApplication, QKeySequence
@@ -27,22 +26,32 @@ if _IS_WINDOWS:
 
     _user32 = ctypes.windll.user32
 
+    # Field offsets let the native filter read single members of a MSG without
+    # instantiating the whole ctypes structure for every window message.
+    _MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+    _MSG_WPARAM_OFFSET = wintypes.MSG.wParam.offset
+
 
 class _WinHotkeyFilter(QAbstractNativeEventFilter):
     """Bridge native WM_HOTKEY events back into Qt signals."""
 
     def __init__(self) -> None:
         super().__init__()
-        self._callbacks: Dict[int, Callable[[], None]] = {}
+        # Hotkey ids are small sequential integers, so a list indexed by id is a
+        # cheaper lookup than a dict for the filter that sees every native message.
+        self._callbacks: List[Optional[Callable[[], None]]] = []
 
     # ------------------------------------------------------------------
     # Registration bookkeeping
     # ------------------------------------------------------------------
     def add(self, hotkey_id: int, callback: Callable[[], None]) -> None:
+        if hotkey_id >= len(self._callbacks):
+            self._callbacks.extend([None] * (hotkey_id + 1 - len(self._callbacks)))
         self._callbacks[hotkey_id] = callback
 
     def remove(self, hotkey_id: int) -> None:
-        self._callbacks.pop(hotkey_id, None)
+        if hotkey_id < len(self._callbacks):
+            self._callbacks[hotkey_id] = None
 
     # ------------------------------------------------------------------
     # Qt hook
@@ -51,12 +60,16 @@ class _WinHotkeyFilter(QAbstractNativeEventFilter):
         if not _IS_WINDOWS or event_type != "windows_generic_MSG":
             return False, 0
 
-        msg = wintypes.MSG.from_address(int(message))
-        if msg.message == WM_HOTKEY:
-            callback = self._callbacks.get(msg.wParam)
-            if callback is not None:
-                callback()
-                return True, 0
+        address = int(message)
+        if wintypes.UINT.from_address(address + _MSG_MESSAGE_OFFSET).value != WM_HOTKEY:
+            return False, 0
+
+        hotkey_id = wintypes.WPARAM.from_address(address + _MSG_WPARAM_OFFSET).value
+        callbacks = self._callbacks
+        callback = callbacks[hotkey_id] if hotkey_id < len(callbacks) else None
+        if callback is not None:
+            callback()
+            return True, 0
         return False, 0
 
 
@@ -65,8 +78,12 @@ class GlobalHotkey(QObject):
 
     activated = Signal()
 
-    _id_counter = itertools.count(1)
+    # RegisterHotKey ids are capped at 0xBFFF, so ids released on unregister are
+    # handed out again before new ones are minted.
+    _free_ids: List[int] = []
+    _next_id: int = 1
     _filter: Optional[_WinHotkeyFilter] = None
+    _native_cache: Dict[str, Tuple[int, int]] = {}
 
     def __init__(self, sequence: QKeySequence, *, auto_register: bool = False, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
@@ -74,9 +91,9 @@ class GlobalHotkey(QObject):
             raise ValueError("GlobalHotkey requires a non-empty key sequence")
 
         self._sequence = sequence
-        self._id = next(self._id_counter)
+        self._id: Optional[int] = None
         self._registered = False
-        self._native: Optional[Tuple[int, int]] = self._sequence_to_native(sequence) if self.is_supported() else None
+        self._native: Optional[Tuple[int, int]] = self._cached_native(sequence) if self.is_supported() else None
 
         if auto_register and not self.setRegistered(True):
             raise RuntimeError("Unable to register global hotkey")
@@ -117,19 +134,26 @@ class GlobalHotkey(QObject):
 
             filter_ = self._ensure_filter(app)
             modifiers, vk = self._native
-            filter_.add(self._id, self._emit_activation)
-            success = bool(_user32.RegisterHotKey(None, self._id, modifiers, vk))
+            hotkey_id = self._acquire_id()
+            filter_.add(hotkey_id, self._emit_activation)
+            success = bool(_user32.RegisterHotKey(None, hotkey_id, modifiers, vk))
             if not success:
-                filter_.remove(self._id)
+                filter_.remove(hotkey_id)
+                self._release_id(hotkey_id)
                 return False
+            self._id = hotkey_id
             self._registered = True
             return True
 
         # disabling
-        _user32.UnregisterHotKey(None, self._id)
+        hotkey_id = self._id
+        assert hotkey_id is not None
+        _user32.UnregisterHotKey(None, hotkey_id)
         filter_ = self._filter
         if filter_ is not None:
-            filter_.remove(self._id)
+            filter_.remove(hotkey_id)
+        self._release_id(hotkey_id)
+        self._id = None
         self._registered = False
         return True
 
@@ -139,6 +163,18 @@ class GlobalHotkey(QObject):
     def _emit_activation(self) -> None:
         self.activated.emit()
 
+    @classmethod
+    def _acquire_id(cls) -> int:
+        if cls._free_ids:
+            return cls._free_ids.pop()
+        hotkey_id = cls._next_id
+        cls._next_id += 1
+        return hotkey_id
+
+    @classmethod
+    def _release_id(cls, hotkey_id: int) -> None:
+        cls._free_ids.append(hotkey_id)
+
     @classmethod
     def _ensure_filter(cls, app: QGuiApplication) -> _WinHotkeyFilter:
         if cls._filter is None:
@@ -146,6 +182,17 @@ class GlobalHotkey(QObject):
             app.installNativeEventFilter(cls._filter)
         return cls._filter
 
+    @classmethod
+    def _cached_native(cls, sequence: QKeySequence) -> Tuple[int, int]:
+        """Return the native translation of ``sequence``, memoised by its text form."""
+
+        key = sequence.toString()
+        native = cls._native_cache.get(key)
+        if native is None:
+            native = cls._sequence_to_native(sequence)
+            cls._native_cache[key] = native
+        return native
+
     @staticmethod
     def _sequence_to_native(sequence: QKeySequence) -> Tuple[int, int]:
         if not _IS_WINDOWS:
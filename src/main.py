@@ -3,10 +3,18 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Optional
-
-from PIL import Image, ImageQt
-from PySide6.QtCore import QSettings, QThreadPool, Qt
+from typing import TYPE_CHECKING, Optional, TypeVar
+
+from PySide6.QtCore import (
+    QMimeData,
+    QRunnable,
+    QSettings,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Slot,
+)
 from PySide6.QtGui import QGuiApplication, QIcon, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
@@ -24,13 +32,17 @@ from PySide6.QtWidgets import (
 )
 
 from hotkeys import GlobalHotkey
-from ocr import OcrConfig
 from overlay import ScreenCaptureOverlay
-from worker import OcrWorker
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime for faster start
+    from ocr import OcrConfig
+    from worker import BatchingOcrWorker
 
 
 ICON_FILENAME = "image.ico"
 
+_OcrJob = TypeVar("_OcrJob", bound=QRunnable)
+
 
 def _resolve_asset(name: str) -> Path | None:
     """Locate *name* across common runtime locations.
@@ -78,22 +90,28 @@ def _load_app_icon() -> QIcon | None:
     return QIcon(str(icon_path))
 
 
-def _pixmap_to_pillow(pixmap) -> Image.Image:
-    """Convert a :class:`~PySide6.QtGui.QPixmap` to a high-DPI aware Pillow image."""
+class _TesseractWarmup(QRunnable):
+    """Background job that primes the OCR stack before the first capture.
 
-    image = ImageQt.fromqpixmap(pixmap)
-    pil_image = image.copy()
-    ratio = (
-        pixmap.devicePixelRatioF()
-        if hasattr(pixmap, "devicePixelRatioF")
-        else pixmap.devicePixelRatio()
-    )
-    if ratio and ratio != 1:
-        width = int(round(pixmap.width() * ratio))
-        height = int(round(pixmap.height() * ratio))
-        if pil_image.size != (width, height):
-            pil_image = pil_image.resize((width, height), Image.LANCZOS)
-    return pil_image
+    Running a tiny recognition on the OCR pool spins up the worker thread, imports
+    the OCR modules and initialises the engine (with tesserocr the per-thread API
+    handle, otherwise the Tesseract binary and its language data in the OS cache)
+    while the user is still choosing a selection.
+    """
+
+    @Slot()
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            from PIL import Image
+
+            from ocr import OcrConfig, perform_ocr
+
+            probe = Image.new("L", (32, 32), 255)
+            # Without some contrast the blank-capture check would skip the engine.
+            probe.paste(0, (8, 8, 24, 24))
+            perform_ocr(probe, OcrConfig())
+        except Exception:  # pragma: no cover - reported again by the real OCR job
+            pass
 
 
 class MainWindow(QMainWindow):
@@ -108,6 +126,11 @@ class MainWindow(QMainWindow):
         self._settings = QSettings("ORC-WIN", "SelectionOCR")
         self._pre_capture_state: Optional[Qt.WindowState] = None
         self._capture_in_progress = False
+        self._clipboard = QApplication.clipboard()
+        self._ocr_jobs = 0
+        # With the Tesseract executable, captures taken while an OCR job runs wait
+        # here and are recognised together by one process once it finishes.
+        self._pending_worker: Optional[BatchingOcrWorker] = None
 
         self._configure_palette()
 
@@ -177,9 +200,19 @@ class MainWindow(QMainWindow):
         self.length_label.setObjectName("lengthLabel")
         self.status_bar.addPermanentWidget(self.length_label)
 
+        # Large pastes emit textChanged many times; recount at most every 30 ms.
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(30)
+        self._count_timer.timeout.connect(self._recompute_length)
+
+        # One job per core: in-process captures are recognised concurrently, each on
+        # a thread-local engine limited to a single OpenMP thread (see ``ocr``), so
+        # the warm-up and OCR jobs never compete for the same core.
         self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(1)
+        self.thread_pool.setMaxThreadCount(QThread.idealThreadCount())
         self.thread_pool.setExpiryTimeout(-1)
+        self.thread_pool.start(_TesseractWarmup())
 
         self.overlay = ScreenCaptureOverlay(self)
         self.overlay.selection_captured.connect(self.handle_capture)
@@ -192,6 +225,8 @@ class MainWindow(QMainWindow):
     @property
     def ocr_config(self) -> OcrConfig:
         if self._ocr_config is None:
+            from ocr import OcrConfig
+
             self._ocr_config = OcrConfig()
         return self._ocr_config
 
@@ -226,15 +261,30 @@ class MainWindow(QMainWindow):
         self.copy_button.setEnabled(False)
         self._set_output_text("")
 
-        image = _pixmap_to_pillow(pixmap)
-        worker = OcrWorker(image=image, config=self.ocr_config)
-        worker.signals.completed.connect(self.on_ocr_complete)
-        worker.signals.failed.connect(self.on_ocr_failed)
-        self.thread_pool.start(worker)
+        from ocr import uses_in_process_engine
+        from worker import BatchingOcrWorker, OcrWorker
+
+        # Only the QPixmap -> QImage grab has to happen on the GUI thread; pixel
+        # conversion and preprocessing run inside the worker.
+        image = pixmap.toImage()
+        config = self.ocr_config
+        # In-process engines gain nothing from batching, so their captures start at
+        # once on a free pool thread. Tesseract processes are costly to start, so
+        # captures arriving while one runs share the next process instead.
+        if self._ocr_jobs and not uses_in_process_engine(config):
+            if self._pending_worker is None:
+                self._pending_worker = self._connect_worker(
+                    BatchingOcrWorker(config=config)
+                )
+            self._pending_worker.add_image(image)
+            return
+
+        self._start_ocr(self._connect_worker(OcrWorker(image=image, config=config)))
 
     def on_ocr_complete(self, text: str) -> None:
         """Handle successful OCR completion."""
 
+        self._ocr_jobs -= 1
         self._set_output_text(text)
         self.copy_button.setEnabled(bool(text))
         self.select_button.setEnabled(True)
@@ -247,13 +297,17 @@ class MainWindow(QMainWindow):
             )
         else:
             self.status_bar.showMessage("OCR finished", 3000)
+        self._start_pending_ocr()
 
     def on_ocr_failed(self, error: str) -> None:
         """Display an error dialog when OCR fails."""
 
+        self._ocr_jobs -= 1
         self.select_button.setEnabled(True)
         self.copy_button.setEnabled(False)
         self.status_bar.clearMessage()
+        # Queued captures do not have to wait for the dialog to be dismissed.
+        self._start_pending_ocr()
         QMessageBox.critical(self, "OCR Failed", error)
 
     def copy_to_clipboard(self) -> None:
@@ -332,12 +386,42 @@ class MainWindow(QMainWindow):
         self._update_character_count(text)
 
     def _on_output_text_changed(self) -> None:
-        """Update UI counters when the output text changes manually."""
+        """Schedule a counter refresh when the output text changes manually."""
+
+        self._count_timer.start()
+
+    def _recompute_length(self) -> None:
+        """Update UI counters from the current editor contents."""
 
         text = self.output_edit.toPlainText()
         self._update_character_count(text)
         self.copy_button.setEnabled(bool(text))
 
+    def _connect_worker(self, worker: _OcrJob) -> _OcrJob:
+        """Wire ``worker``'s signals to the OCR result handlers and return it."""
+
+        worker.signals.completed.connect(self.on_ocr_complete)
+        worker.signals.failed.connect(self.on_ocr_failed)
+        return worker
+
+    def _start_ocr(self, worker: QRunnable) -> None:
+        """Run ``worker`` on the OCR pool and count it as busy until it reports."""
+
+        self._ocr_jobs += 1
+        self.thread_pool.start(worker)
+
+    def _start_pending_ocr(self) -> None:
+        """Recognise the captures queued while earlier OCR jobs were running."""
+
+        if self._ocr_jobs:
+            return
+        worker, self._pending_worker = self._pending_worker, None
+        if worker is None:
+            return
+        self.status_bar.showMessage("Running OCR…")
+        self.copy_button.setEnabled(False)
+        self._start_ocr(worker)
+
     def _update_character_count(self, text: str) -> None:
         """Reflect the current number of characters in the status bar label."""
 
@@ -351,7 +435,11 @@ class MainWindow(QMainWindow):
     ) -> None:
         """Copy ``text`` to the clipboard and optionally emit a status message."""
 
-        QApplication.clipboard().setText(text)
+        # The clipboard takes ownership of the mime data, so a fresh instance is
+        # needed per copy.
+        mime = QMimeData()
+        mime.setText(text)
+        self._clipboard.setMimeData(mime)
         if announce:
             self.status_bar.showMessage(
                 message or "Text copied to clipboard",
@@ -359,12 +447,14 @@ class MainWindow(QMainWindow):
             )
 
     def _install_shortcuts(self) -> None:
-        """Configure keyboard shortcuts and global hotkeys."""
+        """Configure the global hotkey, falling back to an application shortcut.
 
-        local_shortcut = QShortcut(QKeySequence("Ctrl+Shift+O"), self)
-        local_shortcut.activated.connect(self.start_selection)
+        Only one of the two is installed so a single key press never triggers
+        :meth:`start_selection` twice while the window has focus.
+        """
 
         if not GlobalHotkey.is_supported():
+            self._install_local_shortcut()
             self.status_bar.showMessage(
                 "Global hotkey unavailable on this platform.",
                 5000,
@@ -377,6 +467,7 @@ class MainWindow(QMainWindow):
             )
         except RuntimeError:
             self._global_hotkey = None
+            self._install_local_shortcut()
             self.status_bar.showMessage(
                 "Could not register global shortcut. Another application may be using it.",
                 5000,
@@ -385,6 +476,13 @@ class MainWindow(QMainWindow):
 
         self._global_hotkey.activated.connect(self.start_selection)
 
+    def _install_local_shortcut(self) -> None:
+        """Register ``Ctrl+Shift+O`` as an application-wide Qt shortcut."""
+
+        local_shortcut = QShortcut(QKeySequence("Ctrl+Shift+O"), self)
+        local_shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+        local_shortcut.activated.connect(self.start_selection)
+
     def _prepare_for_capture(self) -> None:
         """Minimise the window so it doesn't obstruct the capture area."""
 
@@ -1,40 +1,132 @@
 """High-level OCR utilities and configuration primitives."""
 from __future__ import annotations
 
+import functools
+import io
 import os
 import platform
+import re
 import shlex
 import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
-from PIL import Image, ImageOps
-import pytesseract
-from pytesseract import TesseractError, TesseractNotFoundError
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime for faster start
+    import tesserocr
+    from PIL import Image
+
+# Parallel captures scale better as several single-threaded Tesseract engines than
+# as engines competing for every core through OpenMP. This must be set before
+# tesserocr loads libtesseract, which happens lazily after this module is
+# imported. Tesseract executables inherit it from the environment; they run one at
+# a time, but OpenMP gains little on screen-sized captures anyway.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 DEFAULT_LANG = "ind+eng"
+# Logical screen resolution on Windows at 100 % scaling; captures on scaled
+# displays carry proportionally more pixels per inch.
+SCREEN_DPI = 96
+# Tesseract rejects resolutions outside this range and substitutes its own guess.
+_MIN_CREDIBLE_DPI = 70
+_MAX_CREDIBLE_DPI = 2400
+AUTOCONTRAST_CUTOFF = 0.5
+# Contrast Limited Adaptive Histogram Equalisation settings for the OpenCV path.
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_GRID = (8, 8)
+# Captures whose shorter edge is below this are enlarged before recognition.
+SMALL_CAPTURE_EDGE = 300
+SMALL_CAPTURE_SCALE = 2
+# Captures whose luminance spans fewer levels than this are treated as blank.
+MIN_DYNAMIC_RANGE = 16
+# Pixel step of the quick contrast sample taken before the full blank check.
+BLANK_SAMPLE_STRIDE = 8
+# tesserocr engines each hold their language models (tens of MB for ``ind+eng``),
+# so every thread keeps only its most recently used few.
+ENGINES_PER_THREAD = 2
+
+# OcrConfig fields that feed ``build_cli_flags``; assigning any of them drops the
+# cached flag string.
+_CLI_FIELDS = frozenset(
+    {"psm", "oem", "extra_flags", "detect_inverted", "load_dictionaries"}
+)
+# Shell control characters that are never accepted inside extra flags.
+_UNSAFE_FLAG_CHARS = re.compile(r"[\n\r&|;]")
+
+
+# tesserocr handles and OpenCV CLAHE objects are not thread-safe, so every OCR
+# worker thread owns its own instead of contending for shared ones.
+_thread_state = threading.local()
+# Bumped by ``clear_ocr_caches`` so every thread rebuilds its engines on next use.
+_engine_generation = 0
 
 
 class OcrError(RuntimeError):
     """Application specific error raised when OCR fails for any reason."""
 
 
-WINDOWS_TESSERACT_LOCATIONS: tuple[Path, ...] = (
-    Path(os.environ.get("PROGRAMFILES", "")) / "Tesseract-OCR" / "tesseract.exe",
-    Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Tesseract-OCR" / "tesseract.exe",
-    Path("C:/Program Files/Tesseract-OCR/tesseract.exe"),
-    Path("C:/Program Files (x86)/Tesseract-OCR/tesseract.exe"),
-)
+# Pillow, pytesseract and the optional extras below are imported on first use so
+# that importing this module stays cheap.
+@functools.cache
+def _numpy():
+    """Return :mod:`numpy` if installed; preprocessing then runs as vectorised passes."""
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - depends on the installed extras
+        return None
+    return numpy
+
+
+@functools.cache
+def _opencv():
+    """Return :mod:`cv2` if installed; grayscale conversion is then followed by CLAHE."""
+
+    try:
+        import cv2
+    except ImportError:  # pragma: no cover - depends on the installed extras
+        return None
+    return cv2
+
+
+@functools.cache
+def _tesserocr():
+    """Return :mod:`tesserocr` if installed; it keeps the engine loaded in-process."""
+
+    try:
+        import tesserocr
+    except ImportError:  # pragma: no cover - depends on the installed extras
+        return None
+    return tesserocr
+
 
+def _windows_tesseract_locations() -> tuple[Path, ...]:
+    """Return the usual install locations of ``tesseract.exe`` on Windows."""
 
+    return (
+        Path(os.environ.get("PROGRAMFILES", "")) / "Tesseract-OCR" / "tesseract.exe",
+        Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Tesseract-OCR" / "tesseract.exe",
+        Path("C:/Program Files/Tesseract-OCR/tesseract.exe"),
+        Path("C:/Program Files (x86)/Tesseract-OCR/tesseract.exe"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def _auto_detect_windows_tesseract() -> Optional[str]:
-    """Return a likely ``tesseract.exe`` path on Windows if one exists."""
+    """Return a likely ``tesseract.exe`` path on Windows if one exists.
+
+    The result is cached because the install location does not change while the
+    application is running.
+    """
 
     if platform.system() != "Windows":
         return None
 
-    for candidate in WINDOWS_TESSERACT_LOCATIONS:
+    for candidate in _windows_tesseract_locations():
         if not candidate:
             continue
         expanded = candidate.expanduser()
@@ -57,7 +149,7 @@ def _validate_extra_flags(flags: Iterable[str]) -> tuple[str, ...]:
         if not flag:
             continue
 
-        if any(char in flag for char in {"\n", "\r", "&", "|", ";"}):
+        if _UNSAFE_FLAG_CHARS.search(flag):
             raise OcrError(
                 "Extra flags contain unsupported control characters. "
                 "Remove shell operators such as ';' or '&'."
@@ -67,8 +159,27 @@ def _validate_extra_flags(flags: Iterable[str]) -> tuple[str, ...]:
     return tuple(sanitised)
 
 
+@functools.cache
+def _cached_tesseract_cmd() -> Optional[str]:
+    """Return the ``TESSERACT_CMD`` environment override, read once per process."""
+
+    return os.getenv("TESSERACT_CMD")
+
+
+@functools.cache
+def _cached_ocr_languages() -> Optional[str]:
+    """Return the ``OCR_LANGUAGES`` environment override, read once per process."""
+
+    return os.getenv("OCR_LANGUAGES")
+
+
+@functools.lru_cache(maxsize=8)
 def _resolve_executable(candidate: str) -> str:
-    """Resolve ``candidate`` into an absolute executable path with validation."""
+    """Resolve ``candidate`` into an absolute executable path with validation.
+
+    Successful lookups are cached so repeated configurations skip the filesystem
+    checks and the ``PATH`` scan; failures are not cached and are retried.
+    """
 
     expanded = os.path.expandvars(os.path.expanduser(candidate))
     if not expanded:
@@ -114,6 +225,27 @@ class OcrConfig:
     extra_flags:
         Additional raw flags forwarded to Tesseract. This allows advanced users to
         configure DPI or turn on experimental features without modifying code.
+    max_image_edge:
+        Upper bound, in pixels, for the longest edge of a capture before it is
+        handed to Tesseract. Larger captures are downscaled since recognition cost
+        grows with pixel count while accuracy plateaus. ``0`` disables the limit.
+    dpi:
+        Resolution of the captured pixels reported to Tesseract so it skips
+        estimating one. ``0`` (the default) uses the resolution stored in the
+        image's ``info["dpi"]``, which the capture worker derives from the
+        screen's device pixel ratio, and falls back to ``SCREEN_DPI``. A positive
+        value overrides it. Either way the value is adjusted when preprocessing
+        resizes the capture.
+    detect_inverted:
+        Let Tesseract retry poorly recognised lines as light-on-dark text, which
+        dark themes need. Disable it to save time on every uncertain line when
+        only dark-on-light text is captured.
+    load_dictionaries:
+        Load the system and frequent-word dictionaries. Off by default to shorten
+        engine start-up; UI text is rarely helped by them, but prose can be.
+
+    ``dpi``, ``detect_inverted`` and ``load_dictionaries`` only apply while
+    ``extra_flags`` is empty, so hand-written flags keep full control.
     """
 
     languages: str = DEFAULT_LANG
@@ -121,10 +253,20 @@ class OcrConfig:
     psm: int = 6
     oem: int = 1
     extra_flags: Iterable[str] = field(default_factory=tuple)
+    max_image_edge: int = 1800
+    dpi: int = 0
+    detect_inverted: bool = True
+    load_dictionaries: bool = False
+    _cli_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name in _CLI_FIELDS:
+            object.__setattr__(self, "_cli_cache", None)
 
     def __post_init__(self) -> None:
         if self.tesseract_cmd is None:
-            env_cmd = os.getenv("TESSERACT_CMD")
+            env_cmd = _cached_tesseract_cmd()
             if env_cmd:
                 self.tesseract_cmd = env_cmd
             else:
@@ -135,43 +277,476 @@ class OcrConfig:
         if self.tesseract_cmd:
             self.tesseract_cmd = _resolve_executable(self.tesseract_cmd)
 
-        env_lang = os.getenv("OCR_LANGUAGES")
+        env_lang = _cached_ocr_languages()
         if env_lang and self.languages == DEFAULT_LANG:
             self.languages = env_lang
 
         self.languages = self.languages.strip()
+        # Materialise the flags once: a generator passed by the caller could only be
+        # iterated a single time.
         self.extra_flags = _validate_extra_flags(self.extra_flags)
+        self.build_cli_flags()
 
     def apply(self) -> None:
-        """Apply the configuration to the active pytesseract runtime."""
+        """Apply the configuration to the active pytesseract runtime.
 
-        if self.tesseract_cmd:
+        Nothing is assigned when pytesseract already points at the configured
+        executable, which is the case for every capture after the first.
+        """
+
+        import pytesseract
+
+        if self.tesseract_cmd and pytesseract.pytesseract.tesseract_cmd != self.tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = self.tesseract_cmd
 
+    @property
+    def cli_flags(self) -> str:
+        """The cached Tesseract CLI flag string, see :meth:`build_cli_flags`."""
+
+        return self.build_cli_flags()
+
     def build_cli_flags(self) -> str:
-        """Compose a CLI flag string consumed by Tesseract."""
+        """Compose a CLI flag string consumed by Tesseract.
+
+        The string is built when the configuration is created and reused until
+        one of the fields it is derived from is reassigned, after which the next
+        call rebuilds it.
+        """
+
+        if self._cli_cache is None:
+            flags: list[str] = []
+            if self.psm >= 0:
+                flags.extend(["--psm", str(self.psm)])
+            if self.oem >= 0:
+                flags.extend(["--oem", str(self.oem)])
+            for name, value in _tuning_variables(self):
+                flags.extend(["-c", f"{name}={value}"])
+            flags.extend(self.extra_flags)
+            self._cli_cache = " ".join(shlex.quote(flag) for flag in flags).strip()
+        return self._cli_cache
+
+
+def _tuning_variables(config: OcrConfig) -> tuple[tuple[str, str], ...]:
+    """Return the Tesseract variables that switch off heuristics ``config`` skips."""
+
+    if config.extra_flags:
+        return ()
+    variables: list[tuple[str, str]] = []
+    if not config.detect_inverted:
+        variables.append(("tessedit_do_invert", "0"))
+    if not config.load_dictionaries:
+        variables.extend([("load_system_dawg", "0"), ("load_freq_dawg", "0")])
+    return tuple(variables)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config() -> OcrConfig:
+    """Return the shared configuration used when callers do not pass one.
+
+    It is built on first use rather than at import time so a bad ``TESSERACT_CMD``
+    is reported by the OCR call instead of breaking the import.
+    """
 
-        flags: list[str] = []
-        if self.psm >= 0:
-            flags.extend(["--psm", str(self.psm)])
-        if self.oem >= 0:
-            flags.extend(["--oem", str(self.oem)])
-        flags.extend(self.extra_flags)
-        return " ".join(shlex.quote(flag) for flag in flags).strip()
+    return OcrConfig()
 
 
-def _preprocess_image(image: Image.Image) -> Image.Image:
+def _activate(config: Optional[OcrConfig]) -> OcrConfig:
+    """Resolve the effective configuration and apply it to pytesseract."""
+
+    engine_config = config or _default_config()
+    engine_config.apply()
+    return engine_config
+
+
+def clear_ocr_caches() -> None:
+    """Forget cached environment values, executable lookups and the default config.
+
+    Call this after changing ``TESSERACT_CMD``, ``OCR_LANGUAGES`` or the Tesseract
+    installation at runtime so the next OCR call picks the changes up. Cached
+    tesserocr engines are ended as well.
+    """
+
+    _cached_tesseract_cmd.cache_clear()
+    _cached_ocr_languages.cache_clear()
+    _resolve_executable.cache_clear()
+    _auto_detect_windows_tesseract.cache_clear()
+    _default_config.cache_clear()
+    # Other threads may be recognising right now, so they release their engines on
+    # their next call; this thread's can go immediately.
+    global _engine_generation
+    _engine_generation += 1
+    _release_thread_engines()
+
+
+def _preprocess_image(image: Image.Image, max_edge: int = 0) -> Optional[Image.Image]:
     """Apply lightweight preprocessing to improve OCR accuracy.
 
     The preprocessing pipeline is intentionally conservative to keep the latency low
-    while still improving contrast for common UI captures.
+    while still improving contrast for common UI captures. Any input mode is
+    accepted and the result is always a new ``"L"`` image whose longest edge is
+    capped at ``max_edge`` (``0`` disables the cap).
+
+    ``None`` is returned for blank captures. Their dynamic range is measured on
+    the grayscale pixels before the contrast step, which would otherwise stretch
+    faint background noise across the full 0..255 range.
+
+    With OpenCV installed the contrast step is CLAHE, which copes better with
+    unevenly lit captures than a global stretch; otherwise NumPy or Pillow apply an
+    autocontrast.
+    """
+
+    if image.mode in {"L", "RGB", "RGBA"} and _opencv() is not None:
+        processed = _preprocess_with_opencv(image)
+    elif image.mode in {"L", "RGB", "RGBA"} and _numpy() is not None:
+        processed = _preprocess_with_numpy(image)
+    else:
+        from PIL import ImageOps
+
+        # ``convert("L")`` handles every source mode (P, LA, CMYK, ...) in one pass.
+        gray = image if image.mode == "L" else image.convert("L")
+        if _is_blank(gray):
+            return None
+        processed = ImageOps.autocontrast(gray, cutoff=AUTOCONTRAST_CUTOFF)
+
+    if processed is None:
+        return None
+    # Capping the size here means everything after preprocessing works on the
+    # smaller image Tesseract will actually see.
+    return _limit_image_size(processed, max_edge)
+
+
+def _preprocess_with_opencv(image: Image.Image) -> Optional[Image.Image]:
+    """Convert ``image`` to grayscale and equalise it with OpenCV's CLAHE.
+
+    Returns ``None`` when the grayscale capture is blank.
     """
 
-    processed = image.convert("L") if image.mode not in {"L", "LA"} else image
-    processed = ImageOps.autocontrast(processed, cutoff=0.5)
+    from PIL import Image
+
+    np, cv2 = _numpy(), _opencv()
+    pixels = np.asarray(image)
+    if pixels.ndim == 2:
+        gray = pixels
+    elif pixels.shape[2] == 4:
+        gray = cv2.cvtColor(pixels, cv2.COLOR_RGBA2GRAY)
+    else:
+        gray = cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
+
+    if _array_is_blank(gray):
+        return None
+
+    # CLAHE objects keep scratch buffers, so each worker thread builds its own once.
+    clahe = getattr(_thread_state, "clahe", None)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=CLAHE_CLIP_LIMIT, tileGridSize=CLAHE_TILE_GRID)
+        _thread_state.clahe = clahe
+    return Image.fromarray(clahe.apply(gray))
+
+
+def _preprocess_with_numpy(image: Image.Image) -> Optional[Image.Image]:
+    """NumPy equivalent of ``convert("L")`` followed by ``autocontrast``.
+
+    Luminance, histogram and lookup are each a single vectorised pass, and the
+    result matches the Pillow pipeline pixel for pixel. Returns ``None`` when the
+    grayscale capture is blank.
+    """
+
+    from PIL import Image
+
+    np = _numpy()
+    pixels = np.asarray(image)
+    if pixels.ndim == 2:
+        gray = pixels
+    else:
+        # ITU-R 601-2 luma in the same fixed-point form Pillow uses for "L".
+        rgb = pixels[..., :3].astype(np.uint32)
+        luma = rgb[..., 0] * 19595 + rgb[..., 1] * 38470 + rgb[..., 2] * 7471 + 0x8000
+        gray = (luma >> 16).astype(np.uint8)
+
+    histogram = np.bincount(gray.ravel(), minlength=256)
+    # The occupied histogram bins give the raw extremes without another pass.
+    occupied = np.flatnonzero(histogram)
+    if int(occupied[-1]) - int(occupied[0]) < MIN_DYNAMIC_RANGE:
+        return None
+
+    cut = int(histogram.sum() * AUTOCONTRAST_CUTOFF // 100)
+    low = int(np.argmax(np.cumsum(histogram) > cut))
+    high = 255 - int(np.argmax(np.cumsum(histogram[::-1]) > cut))
+    if high <= low:
+        return Image.fromarray(gray)
+
+    scale = 255.0 / (high - low)
+    lut = np.clip(np.arange(256) * scale - low * scale, 0, 255).astype(np.uint8)
+    return Image.fromarray(lut[gray])
+
+
+def _is_blank(image: Image.Image) -> bool:
+    """Return ``True`` when the grayscale ``image`` is too uniform to contain text.
+
+    Every eighth pixel in each direction is checked first: a capture with visible
+    text almost always shows enough contrast there, so the full scan only runs
+    for selections that look uniform in the sample.
+    """
+
+    from PIL import Image
+
+    width, height = image.size
+    if width >= 2 * BLANK_SAMPLE_STRIDE and height >= 2 * BLANK_SAMPLE_STRIDE:
+        # NEAREST picks single source pixels, so the sample keeps the real extremes.
+        sample = image.resize(
+            (width // BLANK_SAMPLE_STRIDE, height // BLANK_SAMPLE_STRIDE), Image.NEAREST
+        )
+        low, high = sample.getextrema()
+        if high - low >= MIN_DYNAMIC_RANGE:
+            return False
+
+    low, high = image.getextrema()
+    return high - low < MIN_DYNAMIC_RANGE
+
+
+def _array_is_blank(gray) -> bool:
+    """Array variant of :func:`_is_blank` for a 2-D ``uint8`` NumPy array."""
+
+    # Slicing a strided sample is a view, so the quick check allocates nothing.
+    sample = gray[::BLANK_SAMPLE_STRIDE, ::BLANK_SAMPLE_STRIDE]
+    if int(sample.max()) - int(sample.min()) >= MIN_DYNAMIC_RANGE:
+        return False
+    return int(gray.max()) - int(gray.min()) < MIN_DYNAMIC_RANGE
+
+
+def _enlarge_small_image(image: Image.Image, max_edge: int) -> Image.Image:
+    """Upscale and sharpen tiny captures such as tooltips for Tesseract.
+
+    Small UI text sits well below the glyph height Tesseract is trained on. A
+    bicubic enlargement followed by a light unsharp mask gives the recogniser
+    crisper strokes than its own internal rescale. Captures that would then exceed
+    ``max_edge`` are left alone.
+    """
+
+    from PIL import Image, ImageFilter
+
+    width, height = image.size
+    if min(width, height) >= SMALL_CAPTURE_EDGE:
+        return image
+    size = (width * SMALL_CAPTURE_SCALE, height * SMALL_CAPTURE_SCALE)
+    if max_edge > 0 and max(size) > max_edge:
+        return image
+    enlarged = image.resize(size, Image.BICUBIC)
+    return enlarged.filter(ImageFilter.UnsharpMask(radius=1, percent=150))
+
+
+def _limit_image_size(image: Image.Image, max_edge: int) -> Image.Image:
+    """Downscale ``image`` so its longest edge does not exceed ``max_edge``.
+
+    A box filter is used because it is far cheaper than Lanczos and just as good
+    for shrinking text before recognition.
+    """
+
+    from PIL import Image
+
+    longest = max(image.size)
+    if max_edge <= 0 or longest <= max_edge:
+        return image
+    scale = max_edge / longest
+    width, height = image.size
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return image.resize(size, Image.BOX)
+
+
+def _tessdata_dir(config: OcrConfig) -> Optional[str]:
+    """Return the ``tessdata`` folder shipped next to the configured executable."""
+
+    if not config.tesseract_cmd:
+        return None
+    candidate = Path(config.tesseract_cmd).parent / "tessdata"
+    return str(candidate) if candidate.is_dir() else None
+
+
+def _get_api(
+    languages: str,
+    psm: int,
+    oem: int,
+    tessdata: Optional[str],
+    variables: tuple[tuple[str, str], ...] = (),
+) -> tesserocr.PyTessBaseAPI:
+    """Return this thread's :class:`tesserocr.PyTessBaseAPI` for the given settings.
+
+    Engines are created on first use and cached per worker thread, keyed by their
+    settings, so switching back to a recent language or mode does not reload its
+    models. Only the ``ENGINES_PER_THREAD`` most recently used engines are kept;
+    older ones are ended. Because every thread owns its engines no lock is needed
+    around recognition.
+    """
+
+    apis = getattr(_thread_state, "apis", None)
+    if apis is None or getattr(_thread_state, "generation", None) != _engine_generation:
+        _release_thread_engines()
+        apis = _thread_state.apis = OrderedDict()
+        _thread_state.generation = _engine_generation
+
+    key = (languages, psm, oem, tessdata, variables)
+    api = apis.get(key)
+    if api is not None:
+        apis.move_to_end(key)
+    else:
+        api_kwargs: dict[str, object] = {"lang": languages}
+        if psm >= 0:
+            api_kwargs["psm"] = psm
+        if oem >= 0:
+            api_kwargs["oem"] = oem
+        if tessdata:
+            api_kwargs["path"] = tessdata
+        if variables:
+            # Dictionary loading is decided during Init, so these cannot be set later.
+            api_kwargs["variables"] = dict(variables)
+        try:
+            api = _tesserocr().PyTessBaseAPI(**api_kwargs)
+        except RuntimeError as exc:
+            raise OcrError(f"Tesseract failed to initialise: {exc}") from exc
+        apis[key] = api
+        while len(apis) > ENGINES_PER_THREAD:
+            apis.popitem(last=False)[1].End()
+    return api
+
+
+def _release_thread_engines() -> None:
+    """End every tesserocr engine cached by the calling thread."""
+
+    apis = getattr(_thread_state, "apis", None)
+    _thread_state.apis = None
+    for api in (apis or {}).values():
+        api.End()
+
+
+def _recognise_in_process(image: Image.Image, config: OcrConfig) -> str:
+    """Run recognition through a persistent :class:`tesserocr.PyTessBaseAPI`."""
+
+    api = _get_api(
+        config.languages,
+        config.psm,
+        config.oem,
+        _tessdata_dir(config),
+        _tuning_variables(config),
+    )
+    api.SetImage(image)
+    api.SetSourceResolution(_image_dpi(image))
+    return api.GetUTF8Text()
+
+
+def _image_dpi(image: Image.Image) -> int:
+    """Return the horizontal resolution recorded in ``image.info``."""
+
+    dpi = image.info.get("dpi")
+    try:
+        value = round(float(dpi[0]))
+    except (TypeError, ValueError, IndexError):
+        return SCREEN_DPI
+    return value if value > 0 else SCREEN_DPI
+
+
+def _prepare_for_recognition(image: Image.Image, config: OcrConfig) -> Optional[Image.Image]:
+    """Preprocess ``image`` for Tesseract, returning ``None`` for blank captures.
+
+    The result carries its effective resolution in ``info["dpi"]``.
+    """
+
+    source_dpi = config.dpi if config.dpi > 0 else _image_dpi(image)
+    # Preprocessing normalises the mode itself and always produces a new image, so
+    # the caller's image is never modified and needs no defensive copy.
+    processed = _preprocess_image(image, config.max_image_edge)
+    if processed is None:
+        return None
+    # Never triggers for downscaled captures: enlarging is limited to max_edge.
+    processed = _enlarge_small_image(processed, config.max_image_edge)
+    # Resizing changes how many pixels cover an inch of the original screen; large
+    # captures capped to ``max_image_edge`` would otherwise drop below 70 DPI.
+    dpi = round(source_dpi * processed.width / image.width)
+    dpi = min(max(dpi, _MIN_CREDIBLE_DPI), _MAX_CREDIBLE_DPI)
+    processed.info["dpi"] = (dpi, dpi)
     return processed
 
 
+def uses_in_process_engine(config: OcrConfig) -> bool:
+    """Return ``True`` when ``config`` can be recognised through tesserocr."""
+
+    # Raw extra flags only make sense on the command line, so configs that use
+    # them keep going through the Tesseract executable.
+    return not config.extra_flags and _tesserocr() is not None
+
+
+def _run_tesseract(target: str, config: OcrConfig) -> str:
+    """Invoke the Tesseract executable through pytesseract for the file ``target``."""
+
+    import pytesseract
+    from pytesseract import TesseractError, TesseractNotFoundError
+
+    try:
+        return pytesseract.image_to_string(
+            target,
+            lang=config.languages,
+            config=config.cli_flags,
+        )
+    except TesseractNotFoundError as exc:  # pragma: no cover - environment specific
+        raise OcrError(
+            "Tesseract executable was not found. Set the TESSERACT_CMD environment "
+            "variable or install Tesseract on this machine."
+        ) from exc
+    except TesseractError as exc:
+        raise OcrError(f"Tesseract failed: {exc}") from exc
+
+
+def _run_tesseract_stdin(image: Image.Image, config: OcrConfig) -> str:
+    """Pipe ``image`` to the Tesseract executable and return what it prints.
+
+    The image travels as BMP over stdin and the text comes back on stdout, so a
+    single recognition neither encodes PNG nor touches a temporary file.
+    """
+
+    import pytesseract
+
+    buffer = io.BytesIO()
+    # BMP is a plain row dump, so encoding is little more than a copy.
+    dpi = _image_dpi(image)
+    image.save(buffer, format="BMP", dpi=(dpi, dpi))
+    # Hand-written flags keep full control, including over the resolution.
+    dpi_flags = [] if config.extra_flags else ["--dpi", str(dpi)]
+
+    command = [
+        pytesseract.pytesseract.tesseract_cmd,
+        "stdin",
+        "stdout",
+        "-l",
+        config.languages,
+        *dpi_flags,
+        # The flags are quoted with ``shlex.quote``, so a POSIX split reverses it.
+        *shlex.split(config.cli_flags),
+    ]
+    # Keep a console window from flashing up when running windowed on Windows.
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    try:
+        completed = subprocess.run(
+            command,
+            input=buffer.getvalue(),
+            capture_output=True,
+            creationflags=creationflags,
+            check=False,
+        )
+    except FileNotFoundError as exc:  # pragma: no cover - environment specific
+        raise OcrError(
+            "Tesseract executable was not found. Set the TESSERACT_CMD environment "
+            "variable or install Tesseract on this machine."
+        ) from exc
+    except OSError as exc:  # pragma: no cover - environment specific
+        raise OcrError(f"Tesseract could not be started: {exc}") from exc
+
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", errors="replace").strip()
+        if not message:
+            message = f"exit code {completed.returncode}"
+        raise OcrError(f"Tesseract failed: {message}")
+    return completed.stdout.decode("utf-8", errors="replace")
+
+
 def perform_ocr(image: Image.Image, config: Optional[OcrConfig] = None) -> str:
     """Run Tesseract OCR for ``image`` and return the detected text.
 
@@ -188,32 +763,76 @@ def perform_ocr(image: Image.Image, config: Optional[OcrConfig] = None) -> str:
         Raised if Tesseract is missing or returns an error payload.
     """
 
-    engine_config = config or OcrConfig()
-    engine_config.apply()
+    engine_config = _activate(config)
 
-    tesseract_kwargs = {
-        "lang": engine_config.languages,
-        "config": engine_config.build_cli_flags(),
-    }
+    processed = _prepare_for_recognition(image, engine_config)
+    if processed is None:
+        return ""
 
-    pil_image = image.copy()
-    if pil_image.mode not in {"RGB", "RGBA", "L", "LA"}:
-        pil_image = pil_image.convert("RGB")
+    if uses_in_process_engine(engine_config):
+        return _recognise_in_process(processed, engine_config).strip()
+
+    return _run_tesseract_stdin(processed, engine_config).strip()
 
-    processed = _preprocess_image(pil_image)
-    if processed.getbbox() is None:
-        return ""
-    try:
-        text = pytesseract.image_to_string(processed, **tesseract_kwargs)
-    except TesseractNotFoundError as exc:  # pragma: no cover - environment specific
-        raise OcrError(
-            "Tesseract executable was not found. Set the TESSERACT_CMD environment "
-            "variable or install Tesseract on this machine."
-        ) from exc
-    except TesseractError as exc:
-        raise OcrError(f"Tesseract failed: {exc}") from exc
 
-    return text.strip()
+def perform_ocr_batch(
+    images: Sequence[Image.Image], config: Optional[OcrConfig] = None
+) -> list[str]:
+    """Run OCR for several ``images`` and return one text per image, in order.
 
+    When the Tesseract executable is used, every capture is recognised by a single
+    process reading an image-list file, so the engine and its language data are
+    loaded once for the whole batch instead of once per image.
+
+    Raises
+    ------
+    OcrError
+        Raised if Tesseract is missing or returns an error payload.
+    """
 
-__all__ = ["OcrConfig", "OcrError", "perform_ocr"]
+    engine_config = _activate(config)
+
+    prepared = [_prepare_for_recognition(image, engine_config) for image in images]
+    results = ["" for _ in prepared]
+    pending = [index for index, processed in enumerate(prepared) if processed is not None]
+    if not pending:
+        return results
+
+    if uses_in_process_engine(engine_config):
+        for index in pending:
+            results[index] = _recognise_in_process(prepared[index], engine_config).strip()
+        return results
+
+    with tempfile.TemporaryDirectory(prefix="orcwin_") as workdir:
+        paths: list[str] = []
+        for position, index in enumerate(pending):
+            path = os.path.join(workdir, f"capture_{position}.bmp")
+            # One Tesseract run cannot take a ``--dpi`` per image, so each file
+            # records its own resolution in the BMP header, which Tesseract reads.
+            dpi = _image_dpi(prepared[index])
+            prepared[index].save(path, format="BMP", dpi=(dpi, dpi))
+            paths.append(path)
+        list_path = os.path.join(workdir, "captures.txt")
+        with open(list_path, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(paths) + "\n")
+
+        output = _run_tesseract(list_path, engine_config)
+
+    # Tesseract terminates every page of a multi-image run with a form feed.
+    pages = output.split("\f")
+    if len(pages) < len(pending):
+        raise OcrError("Tesseract returned fewer pages than captures were queued")
+    for index, page in zip(pending, pages):
+        results[index] = page.strip()
+    return results
+
+
+__all__ = [
+    "SCREEN_DPI",
+    "OcrConfig",
+    "OcrError",
+    "clear_ocr_caches",
+    "perform_ocr",
+    "perform_ocr_batch",
+    "uses_in_process_engine",
+]
@@ -3,9 +3,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import QPoint, QRect, QSize, Qt, Signal
-from PySide6.QtGui import QColor, QCursor, QGuiApplication, QPainter, QPixmap
-from PySide6.QtWidgets import QRubberBand, QWidget
+from PySide6.QtCore import QPoint, QRect, QRectF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QCursor, QGuiApplication, QImage, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QWidget
+
+# Translucent black laid over everything outside the selection.
+OVERLAY_COLOR = QColor(0, 0, 0, 160)
 
 
 class ScreenCaptureOverlay(QWidget):
@@ -17,7 +20,18 @@ class ScreenCaptureOverlay(QWidget):
         super().__init__(parent)
         self._origin = QPoint()
         self._current_rect = QRect()
-        self._rubber_band = QRubberBand(QRubberBand.Rectangle, self)
+        self._dim_image = QImage()
+        self._selecting = False
+        # The selection outline is stroked by ``paintEvent`` itself instead of a
+        # QRubberBand, which would be a second native widget repainting per move.
+        self._selection_pen = QPen(Qt.white, 2, Qt.DashLine)
+        # High polling rate mice report far more moves than the screen can show, so
+        # drag repaints are coalesced into at most one per ~60 Hz frame.
+        self._dirty_rect = QRect()
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.setInterval(16)
+        self._paint_timer.timeout.connect(self._apply_pending_update)
 
         self.setWindowFlags(
             Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool | Qt.NoDropShadowWindowHint
@@ -35,7 +49,9 @@ class ScreenCaptureOverlay(QWidget):
         """Display the overlay on the screen that currently hosts the cursor."""
 
         self._current_rect = QRect()
-        self._rubber_band.hide()
+        self._selecting = False
+        self._dirty_rect = QRect()
+        self._paint_timer.stop()
 
         cursor_pos = QCursor.pos()
         screen = QGuiApplication.screenAt(cursor_pos) or QGuiApplication.primaryScreen()
@@ -45,6 +61,15 @@ class ScreenCaptureOverlay(QWidget):
 
         geometry = screen.geometry()
         self.setGeometry(geometry)
+        # Rendered once per capture at the screen's physical resolution; painting
+        # then only blits the strips of it that lie outside the selection, without
+        # any per-frame fill or DPI scaling.
+        ratio = screen.devicePixelRatio()
+        self._dim_image = QImage(
+            geometry.size() * ratio, QImage.Format.Format_ARGB32_Premultiplied
+        )
+        self._dim_image.fill(OVERLAY_COLOR)
+        self._dim_image.setDevicePixelRatio(ratio)
         if self.windowHandle() is not None:
             self.windowHandle().setScreen(screen)
         self.show()
@@ -65,12 +90,18 @@ class ScreenCaptureOverlay(QWidget):
     def paintEvent(self, event) -> None:  # noqa: N802 - Qt API naming convention
         del event
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        overlay_color = QColor(0, 0, 0, 160)
-        painter.fillRect(self.rect(), overlay_color)
-        if not self._current_rect.isNull():
-            painter.setCompositionMode(QPainter.CompositionMode_Clear)
-            painter.fillRect(self._current_rect, QColor(0, 0, 0, 0))
+        # The translucent window starts each paint cleared, so leaving the
+        # selection untouched is enough to keep it see-through.
+        ratio = self._dim_image.devicePixelRatio()
+        for strip in self._dim_strips():
+            # Source rectangles are in image pixels, target ones in logical pixels.
+            source = QRectF(
+                strip.x() * ratio, strip.y() * ratio, strip.width() * ratio, strip.height() * ratio
+            )
+            painter.drawImage(QRectF(strip), self._dim_image, source)
+        if self._selecting and not self._current_rect.isEmpty():
+            painter.setPen(self._selection_pen)
+            painter.drawRect(self._current_rect)
         painter.end()
 
     def keyPressEvent(self, event) -> None:  # noqa: N802 - Qt API naming convention
@@ -84,23 +115,27 @@ class ScreenCaptureOverlay(QWidget):
         if event.button() == Qt.LeftButton:
             self._origin = event.pos()
             self._current_rect = QRect(self._origin, QSize())
-            self._rubber_band.setGeometry(self._current_rect)
-            self._rubber_band.show()
+            self._selecting = True
             event.accept()
             self.update()
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event) -> None:  # noqa: N802 - Qt API naming convention
-        if not self._rubber_band.isVisible():
+        if not self._selecting:
             return
+        previous_rect = self._current_rect
         self._current_rect = QRect(self._origin, event.pos()).normalized()
-        self._rubber_band.setGeometry(self._current_rect)
-        self.update()
+        # Only the area covered by the old or new selection changes appearance.
+        self._dirty_rect = self._dirty_rect.united(previous_rect.united(self._current_rect))
+        if not self._paint_timer.isActive():
+            self._paint_timer.start()
 
     def mouseReleaseEvent(self, event) -> None:  # noqa: N802 - Qt API naming convention
-        if event.button() == Qt.LeftButton and self._rubber_band.isVisible():
-            self._rubber_band.hide()
+        if event.button() == Qt.LeftButton and self._selecting:
+            self._selecting = False
+            self._paint_timer.stop()
+            self._dirty_rect = QRect()
             rect = QRect(self._origin, event.pos()).normalized()
             self._current_rect = rect
             if rect.width() < 5 or rect.height() < 5:
@@ -114,6 +149,36 @@ class ScreenCaptureOverlay(QWidget):
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _apply_pending_update(self) -> None:
+        """Repaint the area touched by the selection since the last frame."""
+
+        if self._dirty_rect.isNull():
+            return
+        # The margin covers the outline pen.
+        self.update(self._dirty_rect.adjusted(-2, -2, 2, 2))
+        self._dirty_rect = QRect()
+
+    def _dim_strips(self) -> list[QRect]:
+        """Return the widget areas outside the current selection that get dimmed."""
+
+        bounds = self.rect()
+        selection = self._current_rect.intersected(bounds)
+        if selection.isEmpty():
+            return [bounds]
+
+        width = bounds.width()
+        return [
+            QRect(0, 0, width, selection.top()),
+            QRect(0, selection.bottom() + 1, width, bounds.height() - selection.bottom() - 1),
+            QRect(0, selection.top(), selection.left(), selection.height()),
+            QRect(
+                selection.right() + 1,
+                selection.top(),
+                width - selection.right() - 1,
+                selection.height(),
+            ),
+        ]
+
     def _emit_capture(self, rect: QRect) -> None:
         """Grab the pixels within ``rect`` and emit them as a :class:`QPixmap`."""
 
@@ -123,6 +188,8 @@ class ScreenCaptureOverlay(QWidget):
             self.selection_captured.emit(QPixmap())
             return
 
+        # grabWindow takes logical coordinates and already returns physical pixels,
+        # so passing device-pixel coordinates here would grab the wrong area.
         capture = screen.grabWindow(
             0,
             global_top_left.x(),
@@ -134,7 +201,11 @@ class ScreenCaptureOverlay(QWidget):
             self.selection_captured.emit(QPixmap())
             return
 
-        capture.setDevicePixelRatio(screen.devicePixelRatio())
+        # Qt 6 tags the grab with the screen ratio itself; some platform plugins do
+        # not, so only fill it in when missing.
+        ratio = screen.devicePixelRatio()
+        if capture.devicePixelRatio() != ratio:
+            capture.setDevicePixelRatio(ratio)
         self.selection_captured.emit(capture)
 
 
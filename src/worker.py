@@ -1,27 +1,60 @@
 """Qt worker infrastructure for executing OCR tasks off the UI thread."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from PIL import Image
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+from PySide6.QtGui import QImage
 
-from ocr import OcrConfig, OcrError, perform_ocr
+from ocr import SCREEN_DPI, OcrConfig, OcrError, perform_ocr, perform_ocr_batch
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime for faster start
+    from PIL import Image
+
+
+def _qimage_to_pillow(qimage: QImage) -> Image.Image:
+    """Convert a :class:`~PySide6.QtGui.QImage` to a grayscale Pillow image.
+
+    The pixels are read straight from the :class:`QImage` buffer instead of going
+    through :mod:`PIL.ImageQt`, which encodes and decodes an intermediate image.
+    The capture is reduced to 8-bit grayscale by Qt first, since OCR preprocessing
+    only works on luminance anyway. The screen resolution the pixels were grabbed
+    at is recorded in ``info["dpi"]`` for Tesseract.
+    """
+
+    from PIL import Image
+
+    converted = qimage.convertToFormat(QImage.Format.Format_Grayscale8)
+    # ``frombytes`` copies the rows once so the Pillow image does not depend on the
+    # lifetime of the QImage buffer. Captured pixmaps already hold physical pixels
+    # (devicePixelRatio only affects painting), so no rescale is needed.
+    image = Image.frombytes(
+        "L",
+        (converted.width(), converted.height()),
+        converted.constBits(),
+        "raw",
+        "L",
+        converted.bytesPerLine(),
+    )
+    # A 150 % display grabs 1.5 physical pixels per logical pixel, i.e. 144 DPI.
+    dpi = round(SCREEN_DPI * qimage.devicePixelRatio())
+    image.info["dpi"] = (dpi, dpi)
+    return image
 
 
 class WorkerSignals(QObject):
-    """Signal bundle emitted by :class:`OcrWorker`."""
+    """Signal bundle emitted by :class:`OcrWorker` and :class:`BatchingOcrWorker`."""
 
     completed = Signal(str)
     failed = Signal(str)
 
 
 class OcrWorker(QRunnable):
-    """Background job that runs OCR using :func:`perform_ocr`."""
+    """Background job that converts a captured frame and runs :func:`perform_ocr`."""
 
-    def __init__(self, *, image: Image.Image, config: Optional[OcrConfig]) -> None:
+    def __init__(self, *, image: QImage, config: Optional[OcrConfig]) -> None:
         super().__init__()
-        self.image = image
+        self.image: Optional[QImage] = image
         self.config = config
         self.signals = WorkerSignals()
 
@@ -30,13 +63,62 @@ class OcrWorker(QRunnable):
         """Execute the OCR job and propagate results via signals."""
 
         try:
-            text = perform_ocr(self.image, self.config)
+            pil_image = _qimage_to_pillow(self.image)
+            text = perform_ocr(pil_image, self.config)
+        except OcrError as exc:
+            self.signals.failed.emit(str(exc))
+        except Exception as exc:  # pragma: no cover - defensive safety net
+            self.signals.failed.emit(f"Unexpected error: {exc}")
+        else:
+            self.signals.completed.emit(text)
+        finally:
+            # Queued signals can keep the job alive after it ran; drop the pixels.
+            self.image = None
+            self.config = None
+
+
+class BatchingOcrWorker(QRunnable):
+    """Background job that recognises every frame queued before it is started.
+
+    Frames are added with :meth:`add_image` until the job is started, e.g. while
+    an earlier OCR job is still running. A lone frame takes the regular
+    :func:`perform_ocr` path; several frames are recognised by one Tesseract run
+    via :func:`perform_ocr_batch` and their texts are joined, in capture order,
+    into the single ``completed`` payload.
+    """
+
+    def __init__(self, *, config: Optional[OcrConfig]) -> None:
+        super().__init__()
+        self.images: List[QImage] = []
+        self.config = config
+        self.signals = WorkerSignals()
+
+    def add_image(self, image: QImage) -> None:
+        """Queue ``image`` for recognition; only valid before the job is started."""
+
+        self.images.append(image)
+
+    @Slot()
+    def run(self) -> None:  # type: ignore[override]
+        """Execute the OCR job and propagate results via signals."""
+
+        try:
+            pil_images = [_qimage_to_pillow(image) for image in self.images]
+            if len(pil_images) == 1:
+                text = perform_ocr(pil_images[0], self.config)
+            else:
+                texts = perform_ocr_batch(pil_images, self.config)
+                text = "\n\n".join(part for part in texts if part)
         except OcrError as exc:
             self.signals.failed.emit(str(exc))
         except Exception as exc:  # pragma: no cover - defensive safety net
             self.signals.failed.emit(f"Unexpected error: {exc}")
         else:
             self.signals.completed.emit(text)
+        finally:
+            # Queued signals can keep the job alive after it ran; drop the pixels.
+            self.images = []
+            self.config = None
 
 
-__all__ = ["OcrWorker", "WorkerSignals"]
+__all__ = ["BatchingOcrWorker", "OcrWorker", "WorkerSignals"]